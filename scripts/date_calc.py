@@ -21,26 +21,56 @@ Usage:
     python date_calc.py holidays 2025         # Specific year
     python date_calc.py holidays --country US # Different country
     python date_calc.py holidays 2025 --country JP
+    python date_calc.py --json info 2025-01-29   # Machine-readable output
 """
 
 import argparse
+import functools
+import importlib.util
+import re
 import sys
 from datetime import datetime, timedelta, date
-from typing import Optional, Tuple, List
-import calendar
+from operator import itemgetter
+from types import MappingProxyType
+from typing import Iterable, Iterator, Optional, Tuple, List
 
-try:
-    import holidays as holidays_lib
-    HOLIDAYS_AVAILABLE = True
-except ImportError:
-    HOLIDAYS_AVAILABLE = False
+# The holidays package is large, so it is only imported on first use
+HOLIDAYS_AVAILABLE = importlib.util.find_spec("holidays") is not None
 
 # Default country for holidays (can be overridden with --country)
 DEFAULT_COUNTRY = "TW"
 
+# Numeric date formats, matched in one pass. The named group that matched
+# tells parse_date which layout it is looking at.
+_DATE_RE = re.compile(
+    r"^(?:(?P<iso_y>\d{4})-(?P<iso_m>\d{1,2})-(?P<iso_d>\d{1,2})"  # 2025-01-29
+    r"|(?P<slash_a>\d{1,2})/(?P<slash_b>\d{1,2})/(?P<slash_y>\d{4})"  # 01/29/2025, 29/01/2025
+    r"|(?P<compact_y>\d{4})(?P<compact_m>\d{2})(?P<compact_d>\d{2}))$",  # 20250129
+    re.ASCII,
+)
+
+# Days per month in a common year
+_MONTH_LEN = (31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+
+# Short weekday names, indexed by date.weekday()
+_WEEKDAY_ABBR = ("Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun")
+
+# Month-name formats, still handled by strptime
+_MONTH_NAME_FORMATS = (
+    "%B %d, %Y",     # January 29, 2025
+    "%b %d, %Y",     # Jan 29, 2025
+)
+
 
 def parse_date(date_str: str) -> date:
     """Parse a date string in various formats."""
+    # Fast path for plain ISO dates, the tool's own output format
+    if len(date_str) == 10 and date_str[4] == "-" and date_str[7] == "-":
+        try:
+            return date.fromisoformat(date_str)
+        except ValueError:
+            pass
+    
     date_str = date_str.lower().strip()
     
     today = date.today()
@@ -53,65 +83,115 @@ def parse_date(date_str: str) -> date:
     elif date_str == "tomorrow":
         return today + timedelta(days=1)
     
-    # Try various date formats
-    formats = [
-        "%Y-%m-%d",      # 2025-01-29
-        "%m/%d/%Y",      # 01/29/2025
-        "%d/%m/%Y",      # 29/01/2025
-        "%B %d, %Y",     # January 29, 2025
-        "%b %d, %Y",     # Jan 29, 2025
-        "%Y%m%d",        # 20250129
-    ]
-    
-    for fmt in formats:
-        try:
-            return datetime.strptime(date_str, fmt).date()
-        except ValueError:
-            continue
+    match = _DATE_RE.match(date_str)
+    if match:
+        if match["iso_y"]:
+            candidates = [(match["iso_y"], match["iso_m"], match["iso_d"])]
+        elif match["slash_y"]:
+            # Month first (US), then day first
+            year, a, b = match["slash_y"], match["slash_a"], match["slash_b"]
+            candidates = [(year, a, b), (year, b, a)]
+        else:
+            candidates = [(match["compact_y"], match["compact_m"], match["compact_d"])]
+        
+        for year, month, day in candidates:
+            try:
+                return date(int(year), int(month), int(day))
+            except ValueError:
+                continue
+    else:
+        for fmt in _MONTH_NAME_FORMATS:
+            try:
+                return datetime.strptime(date_str, fmt).date()
+            except ValueError:
+                continue
     
     raise ValueError(f"Unable to parse date: {date_str}")
 
 
+@functools.lru_cache(maxsize=1)
+def _holidays_lib():
+    """Import the holidays library on first use; None if it is unavailable."""
+    if not HOLIDAYS_AVAILABLE:
+        return None
+    try:
+        import holidays
+    except ImportError:
+        return None
+    return holidays
+
+
 def get_holidays(year: int, country: str = DEFAULT_COUNTRY) -> List[Tuple[date, str]]:
     """Get all holidays for a year and country using the holidays library."""
-    if not HOLIDAYS_AVAILABLE:
+    holidays_lib = _holidays_lib()
+    if holidays_lib is None:
         return []
     
     try:
         country_holidays = holidays_lib.country_holidays(country, years=year)
-        return sorted([(d, name) for d, name in country_holidays.items()])
+        return sorted(country_holidays.items(), key=itemgetter(0))
     except NotImplementedError:
         print(f"Warning: Country '{country}' not supported", file=sys.stderr)
         return []
 
 
-def is_holiday(d: date, country: str = DEFAULT_COUNTRY) -> Optional[str]:
-    """Check if a date is a holiday in the specified country."""
-    if not HOLIDAYS_AVAILABLE:
-        return None
+@functools.lru_cache(maxsize=32)
+def _holidays_for(country: str, *years: int) -> dict:
+    """Get the holiday map for a country and years, built once and cached."""
+    holidays_lib = _holidays_lib()
+    if holidays_lib is None:
+        return {}
     
     try:
-        country_holidays = holidays_lib.country_holidays(country, years=d.year)
-        return country_holidays.get(d)
+        return holidays_lib.country_holidays(country, years=list(years))
     except NotImplementedError:
-        return None
+        return {}
+
+
+def is_holiday(d: date, country: str = DEFAULT_COUNTRY) -> Optional[str]:
+    """Check if a date is a holiday in the specified country."""
+    return _holidays_for(country, d.year).get(d)
 
 
-def list_supported_countries() -> List[str]:
+@functools.lru_cache(maxsize=1)
+def list_supported_countries() -> Tuple[str, ...]:
     """List all supported country codes."""
-    if not HOLIDAYS_AVAILABLE:
-        return []
-    return sorted(holidays_lib.list_supported_countries().keys())
+    holidays_lib = _holidays_lib()
+    if holidays_lib is None:
+        return ()
+    return tuple(sorted(holidays_lib.list_supported_countries().keys()))
+
+
+def _is_leap(year: int) -> bool:
+    # Same as %4 / %100 / %400: once y is a multiple of 4, y % 100 == 0
+    # iff y % 25 == 0, and y % 400 == 0 iff y % 16 == 0.
+    return year & 3 == 0 and (year % 25 != 0 or year & 15 == 0)
 
 
 def is_leap_year(year: int) -> bool:
     """Check if a year is a leap year."""
-    return calendar.isleap(year)
+    return _is_leap(year)
 
 
 def days_in_month(year: int, month: int) -> int:
     """Get the number of days in a month."""
-    return calendar.monthrange(year, month)[1]
+    if not 1 <= month <= 12:
+        raise ValueError(f"bad month number {month}; must be 1-12")
+    return _MONTH_LEN[month - 1] + (month == 2 and _is_leap(year))
+
+
+def _rd(year: int, month: int, day: int) -> int:
+    """Day count since 0000-03-01 (Neri & Schneider's rata die).
+
+    Years are shifted to start in March so that Jan/Feb become months 13/14
+    of the previous year; the leap day then falls at the end of a year and
+    both the year and month offsets are closed-form integer expressions.
+    """
+    j = month <= 2
+    y = year - j
+    m = month + 12 * j
+    c = y // 100
+    return 1461 * y // 4 - c + c // 4 + (979 * m - 2919) // 32 + day - 1
 
 
 def get_quarter(d: date) -> int:
@@ -125,68 +205,107 @@ def get_week_number(d: date) -> Tuple[int, int]:
     return iso_cal[0], iso_cal[1]
 
 
-def date_info(d: date, country: str = DEFAULT_COUNTRY) -> dict:
-    """Get comprehensive information about a date."""
+@functools.lru_cache(maxsize=4096)
+def _date_info_static(d: date) -> MappingProxyType:
+    """The date_info fields that depend on neither today nor holidays, cached per date."""
+    rd = _rd(d.year, d.month, d.day)
+    weekday = d.weekday()
     week_year, week_num = get_week_number(d)
+    # One strftime call for all the localized names, split on a unit separator
+    day_name, month_name, formatted = d.strftime("%A\x1f%B\x1f%A, %B %d, %Y").split("\x1f")
     
-    info = {
+    # Read-only, since every caller shares the cached mapping
+    return MappingProxyType({
         "date": d.isoformat(),
-        "formatted": d.strftime("%A, %B %d, %Y"),
-        "day_of_week": d.strftime("%A"),
-        "day_of_week_num": d.weekday(),  # 0=Monday, 6=Sunday
+        "formatted": formatted,
+        "day_of_week": day_name,
+        "day_of_week_num": weekday,  # 0=Monday, 6=Sunday
         "day_of_month": d.day,
-        "month": d.strftime("%B"),
+        "month": month_name,
         "month_num": d.month,
         "year": d.year,
         "quarter": get_quarter(d),
         "week_number": week_num,
         "week_year": week_year,
-        "day_of_year": d.timetuple().tm_yday,
+        "day_of_year": rd - _rd(d.year, 1, 1) + 1,
         "days_in_month": days_in_month(d.year, d.month),
         "is_leap_year": is_leap_year(d.year),
-        "is_weekend": d.weekday() >= 5,
-        "holiday": is_holiday(d, country),
-    }
-    
-    # Days from today
-    today = date.today()
+        "is_weekend": weekday > 4,
+    })
+
+
+def _relative(d: date, today: date) -> str:
+    """Describe d relative to today."""
     delta = (d - today).days
     if delta == 0:
-        info["relative"] = "today"
+        return "today"
     elif delta == 1:
-        info["relative"] = "tomorrow"
+        return "tomorrow"
     elif delta == -1:
-        info["relative"] = "yesterday"
+        return "yesterday"
     elif delta > 0:
-        info["relative"] = f"in {delta} days"
+        return f"in {delta} days"
     else:
-        info["relative"] = f"{-delta} days ago"
+        return f"{-delta} days ago"
+
+
+def date_info_batch(dates: Iterable[date], country: str = DEFAULT_COUNTRY) -> List[dict]:
+    """Get comprehensive information about many dates.
+
+    A single holiday map covering every year in the batch is built (or
+    fetched from cache) once and shared, the holiday-independent fields are
+    cached per date, and "today" is read once for the whole batch.
+    """
+    dates = list(dates)
+    if not dates:
+        return []
     
-    return info
+    country_holidays = _holidays_for(country, *sorted({d.year for d in dates}))
+    today = date.today()
+    return [
+        {**_date_info_static(d), "holiday": country_holidays.get(d), "relative": _relative(d, today)}
+        for d in dates
+    ]
+
+
+def date_info(d: date, country: str = DEFAULT_COUNTRY) -> dict:
+    """Get comprehensive information about a date."""
+    return date_info_batch([d], country)[0]
+
+
+def _add_months(d: date, amount: int) -> date:
+    new_year, new_month = divmod(d.year * 12 + d.month - 1 + amount, 12)
+    new_month += 1
+    # Handle day overflow (e.g., Jan 31 + 1 month)
+    new_day = min(d.day, days_in_month(new_year, new_month))
+    return date(new_year, new_month, new_day)
+
+
+def _add_years(d: date, amount: int) -> date:
+    new_year = d.year + amount
+    # Handle Feb 29 in non-leap years
+    new_day = min(d.day, days_in_month(new_year, d.month))
+    return date(new_year, d.month, new_day)
+
+
+# add_to_date handlers, keyed by normalized (singular) unit
+_UNIT_HANDLERS = {
+    "day": lambda d, amount: d + timedelta(days=amount),
+    "week": lambda d, amount: d + timedelta(weeks=amount),
+    "month": _add_months,
+    "year": _add_years,
+}
 
 
 def add_to_date(d: date, amount: int, unit: str) -> date:
     """Add time to a date."""
     unit = unit.lower().rstrip('s')  # Normalize: days -> day
     
-    if unit == "day":
-        return d + timedelta(days=amount)
-    elif unit == "week":
-        return d + timedelta(weeks=amount)
-    elif unit == "month":
-        new_month = d.month + amount
-        new_year = d.year + (new_month - 1) // 12
-        new_month = ((new_month - 1) % 12) + 1
-        # Handle day overflow (e.g., Jan 31 + 1 month)
-        new_day = min(d.day, days_in_month(new_year, new_month))
-        return date(new_year, new_month, new_day)
-    elif unit == "year":
-        new_year = d.year + amount
-        # Handle Feb 29 in non-leap years
-        new_day = min(d.day, days_in_month(new_year, d.month))
-        return date(new_year, d.month, new_day)
-    else:
-        raise ValueError(f"Unknown unit: {unit}. Use day, week, month, or year.")
+    try:
+        handler = _UNIT_HANDLERS[unit]
+    except KeyError:
+        raise ValueError(f"Unknown unit: {unit}. Use day, week, month, or year.") from None
+    return handler(d, amount)
 
 
 def date_diff(d1: date, d2: date) -> dict:
@@ -197,7 +316,7 @@ def date_diff(d1: date, d2: date) -> dict:
     else:
         swapped = False
     
-    delta = d2 - d1
+    total_days = (d2 - d1).days
     
     # Calculate years, months, days
     years = d2.year - d1.year
@@ -206,19 +325,21 @@ def date_diff(d1: date, d2: date) -> dict:
     
     if days < 0:
         months -= 1
-        days += days_in_month(d2.year, d2.month - 1 if d2.month > 1 else 12)
+        # Borrow the length of the month before d2
+        prev_year, prev_month = divmod(d2.year * 12 + d2.month - 2, 12)
+        days += days_in_month(prev_year, prev_month + 1)
     
     if months < 0:
         years -= 1
         months += 12
     
     # Calculate weeks
-    weeks = delta.days // 7
-    remaining_days = delta.days % 7
+    weeks = total_days // 7
+    remaining_days = total_days % 7
     
     return {
-        "total_days": delta.days * (-1 if swapped else 1),
-        "total_weeks": round(delta.days / 7, 2),
+        "total_days": total_days * (-1 if swapped else 1),
+        "total_weeks": round(total_days / 7, 2),
         "weeks_and_days": f"{weeks} weeks, {remaining_days} days",
         "years_months_days": f"{years} years, {months} months, {days} days",
         "calendar_months": years * 12 + months,
@@ -227,155 +348,237 @@ def date_diff(d1: date, d2: date) -> dict:
     }
 
 
-def date_range(start: date, end: date) -> List[dict]:
-    """Get information for each date in a range."""
+def date_range(start: date, end: date, country: str = DEFAULT_COUNTRY) -> Iterator[dict]:
+    """Yield information for each date in a range."""
     if start > end:
         start, end = end, start
     
-    dates = []
-    current = start
-    while current <= end:
-        info = date_info(current)
-        dates.append({
-            "date": info["date"],
-            "day": info["day_of_week"][:3],
-            "holiday": info["holiday"],
-            "weekend": info["is_weekend"],
-        })
-        current += timedelta(days=1)
+    # One holiday map covering every year in the range
+    country_holidays = _holidays_for(country, *range(start.year, end.year + 1))
     
-    return dates
+    # Walk proleptic ordinals; ordinal 1 (0001-01-01) is a Monday, which
+    # gives the weekday as (n + 6) % 7 without a per-day method call.
+    for n in range(start.toordinal(), end.toordinal() + 1):
+        current = date.fromordinal(n)
+        weekday = (n + 6) % 7
+        yield {
+            "date": current.isoformat(),
+            "day": _WEEKDAY_ABBR[weekday],
+            "holiday": country_holidays.get(current),
+            "weekend": weekday >= 5,
+        }
+
+
+def format_range_stream(items: Iterable) -> Iterator[str]:
+    """Yield one display line per item, without holding the whole range."""
+    for item in items:
+        if isinstance(item, dict):
+            line = f"{item.get('date', '')}"
+            if item.get('day'):
+                line += f" ({item['day']})"
+            if item.get('holiday'):
+                line += f" [{item['holiday']}]"
+            if item.get('weekend'):
+                line += " [weekend]"
+            yield line
+        else:
+            yield str(item)
 
 
 def format_output(data, verbose: bool = False) -> str:
     """Format output for display."""
     if isinstance(data, dict):
-        lines = []
-        for key, value in data.items():
-            if value is not None and value != "":
-                lines.append(f"  {key}: {value}")
-        return "\n".join(lines)
+        return "\n".join(f"  {key}: {value}" for key, value in data.items() if value is not None and value != "")
     elif isinstance(data, list):
-        lines = []
-        for item in data:
-            if isinstance(item, dict):
-                parts = [f"{item.get('date', '')}"]
-                if item.get('day'):
-                    parts.append(f"({item['day']})")
-                if item.get('holiday'):
-                    parts.append(f"[{item['holiday']}]")
-                if item.get('weekend'):
-                    parts.append("[weekend]")
-                lines.append(" ".join(parts))
-            else:
-                lines.append(str(item))
-        return "\n".join(lines)
+        return "\n".join(format_range_stream(data))
     return str(data)
 
 
-def main():
-    parser = argparse.ArgumentParser(description="Date and calendar calculations")
-    subparsers = parser.add_subparsers(dest="command", help="Commands")
-    
-    # Info command
-    info_parser = subparsers.add_parser("info", help="Get date information")
-    info_parser.add_argument("date", help="Date (YYYY-MM-DD, today, tomorrow, etc.)")
-    
-    # Add command
-    add_parser = subparsers.add_parser("add", help="Add time to a date")
-    add_parser.add_argument("date", help="Start date")
-    add_parser.add_argument("amount", type=int, help="Amount to add (negative to subtract)")
-    add_parser.add_argument("unit", choices=["days", "weeks", "months", "years"], help="Unit")
-    
-    # Diff command
-    diff_parser = subparsers.add_parser("diff", help="Difference between two dates")
-    diff_parser.add_argument("date1", help="First date")
-    diff_parser.add_argument("date2", help="Second date")
+# CLI subcommands: name -> (help, [(positional args, keyword args), ...])
+_SUBCOMMANDS = {
+    "info": ("Get date information", [
+        (("date",), {"help": "Date (YYYY-MM-DD, today, tomorrow, etc.)"}),
+    ]),
+    "add": ("Add time to a date", [
+        (("date",), {"help": "Start date"}),
+        (("amount",), {"type": int, "help": "Amount to add (negative to subtract)"}),
+        (("unit",), {"choices": ["days", "weeks", "months", "years"], "help": "Unit"}),
+    ]),
+    "diff": ("Difference between two dates", [
+        (("date1",), {"help": "First date"}),
+        (("date2",), {"help": "Second date"}),
+    ]),
+    "range": ("List dates in a range", [
+        (("start",), {"help": "Start date"}),
+        (("end",), {"help": "End date"}),
+    ]),
+    "relative": ("Get relative date info", [
+        (("date",), {"help": "Date to describe"}),
+    ]),
+    "holidays": ("List holidays for a year", [
+        (("year",), {"type": int, "nargs": "?", "default": None, "help": "Year (defaults to current year)"}),
+        (("--country", "-c"), {"default": DEFAULT_COUNTRY, "help": f"Country code (default: {DEFAULT_COUNTRY}). Use 'list' to see all supported countries."}),
+    ]),
+    "weekday": ("Get day of week for a date", [
+        (("date",), {"help": "Date"}),
+    ]),
+}
+
+
+class _ParseError(Exception):
+    """Raised instead of exiting when a trimmed parser rejects argv."""
+
+
+class _TrimmedParser(argparse.ArgumentParser):
+    def error(self, message):
+        raise _ParseError(message)
+
+
+def _build_parser(argv: List[str], full: bool = False) -> argparse.ArgumentParser:
+    """Build the CLI parser.
+
+    Unless full is set, only the subcommand named in argv is constructed, and
+    the parser raises _ParseError instead of reporting errors itself so the
+    caller can retry with the full parser. All subcommands are added when
+    there is no known command or top-level help is asked for.
+    """
+    command = None
+    if not full:
+        for arg in argv:
+            if arg in ("-h", "--help"):
+                break
+            if not arg.startswith("-"):
+                command = arg
+                break
+    trimmed = command in _SUBCOMMANDS
+    names = [command] if trimmed else list(_SUBCOMMANDS)
     
-    # Range command
-    range_parser = subparsers.add_parser("range", help="List dates in a range")
-    range_parser.add_argument("start", help="Start date")
-    range_parser.add_argument("end", help="End date")
-    
-    # Relative command
-    rel_parser = subparsers.add_parser("relative", help="Get relative date info")
-    rel_parser.add_argument("date", help="Date to describe")
+    parser_class = _TrimmedParser if trimmed else argparse.ArgumentParser
+    parser = parser_class(description="Date and calendar calculations")
+    parser.add_argument("--json", action="store_true", help="Print results as JSON (one object per line for range)")
+    subparsers = parser.add_subparsers(dest="command", help="Commands")
     
-    # Holidays command
-    hol_parser = subparsers.add_parser("holidays", help="List holidays for a year")
-    hol_parser.add_argument("year", type=int, nargs="?", default=None, help="Year (defaults to current year)")
-    hol_parser.add_argument("--country", "-c", default=DEFAULT_COUNTRY, help=f"Country code (default: {DEFAULT_COUNTRY}). Use 'list' to see all supported countries.")
+    for name in names:
+        help_text, arguments = _SUBCOMMANDS[name]
+        sub = subparsers.add_parser(name, help=help_text)
+        for flags, kwargs in arguments:
+            sub.add_argument(*flags, **kwargs)
     
-    # Weekday command
-    wd_parser = subparsers.add_parser("weekday", help="Get day of week for a date")
-    wd_parser.add_argument("date", help="Date")
+    return parser
+
+
+def _print_json(data) -> None:
+    """Print data as a single line of JSON; dates are written as ISO strings."""
+    import json  # Only --json runs need it, so keep it off the startup path
     
-    args = parser.parse_args()
+    sys.stdout.write(json.dumps(data, default=str))
+    sys.stdout.write("\n")
+
+
+def main():
+    argv = sys.argv[1:]
+    parser = _build_parser(argv)
+    try:
+        args = parser.parse_args(argv)
+    except _ParseError:
+        # Re-parse with every subcommand so the error and usage list them all
+        parser = _build_parser(argv, full=True)
+        args = parser.parse_args(argv)
     
     try:
         if args.command == "info":
             d = parse_date(args.date)
-            print(f"\n📅 Date Information for {d.strftime('%B %d, %Y')}")
-            print("-" * 40)
-            print(format_output(date_info(d)))
+            info = date_info(d)
+            if args.json:
+                _print_json(info)
+            else:
+                print(f"\n📅 Date Information for {d.strftime('%B %d, %Y')}")
+                print("-" * 40)
+                print(format_output(info))
             
         elif args.command == "add":
             d = parse_date(args.date)
             result = add_to_date(d, args.amount, args.unit)
-            info = date_info(result)
-            print(f"\n📅 {d} + {args.amount} {args.unit} = {result}")
-            print(f"   → {info['formatted']}")
+            formatted = result.strftime('%A, %B %d, %Y')
+            if args.json:
+                _print_json({
+                    "date": d,
+                    "amount": args.amount,
+                    "unit": args.unit,
+                    "result": result,
+                    "formatted": formatted,
+                })
+            else:
+                print(f"\n📅 {d} + {args.amount} {args.unit} = {result}")
+                print(f"   → {formatted}")
             
         elif args.command == "diff":
             d1 = parse_date(args.date1)
             d2 = parse_date(args.date2)
             diff = date_diff(d1, d2)
-            print(f"\n📅 Difference: {d1} → {d2}")
-            print("-" * 40)
-            print(format_output(diff))
+            if args.json:
+                _print_json(diff)
+            else:
+                print(f"\n📅 Difference: {d1} → {d2}")
+                print("-" * 40)
+                print(format_output(diff))
             
         elif args.command == "range":
             start = parse_date(args.start)
             end = parse_date(args.end)
-            dates = date_range(start, end)
-            print(f"\n📅 Date Range: {start} to {end}")
-            print("-" * 40)
-            print(format_output(dates))
+            if args.json:
+                # Newline-delimited JSON, one record per day
+                for item in date_range(start, end):
+                    _print_json(item)
+            else:
+                print(f"\n📅 Date Range: {start} to {end}")
+                print("-" * 40)
+                # writelines drains the generator, so the range is still streamed
+                sys.stdout.writelines(f"{line}\n" for line in format_range_stream(date_range(start, end)))
             
         elif args.command == "relative":
             d = parse_date(args.date)
             info = date_info(d)
-            print(f"\n📅 {info['formatted']} is {info['relative']}")
+            if args.json:
+                _print_json({key: info[key] for key in ("date", "formatted", "relative")})
+            else:
+                print(f"\n📅 {info['formatted']} is {info['relative']}")
             
         elif args.command == "holidays":
             if args.country.lower() == "list":
                 countries = list_supported_countries()
-                print(f"\n📅 Supported Countries ({len(countries)} total)")
-                print("-" * 40)
-                # Print in columns
-                for i in range(0, len(countries), 8):
-                    print("  " + "  ".join(countries[i:i+8]))
+                if args.json:
+                    _print_json(countries)
+                else:
+                    out_lines = ["", f"📅 Supported Countries ({len(countries)} total)", "-" * 40]
+                    # Print in columns
+                    out_lines.extend("  " + "  ".join(countries[i:i+8]) for i in range(0, len(countries), 8))
+                    sys.stdout.write("\n".join(out_lines) + "\n")
             else:
-                if not HOLIDAYS_AVAILABLE:
+                if _holidays_lib() is None:
                     print("Error: 'holidays' library not installed.", file=sys.stderr)
                     print("Install with: pip install holidays", file=sys.stderr)
                     sys.exit(1)
                 year = args.year if args.year else date.today().year
                 holidays = get_holidays(year, args.country)
-                print(f"\n📅 Holidays in {args.country} for {year}")
-                print("-" * 40)
-                if holidays:
-                    for hdate, name in holidays:
-                        day = hdate.strftime("%A")
-                        print(f"  {hdate} ({day[:3]}): {name}")
+                if args.json:
+                    _print_json([{"date": hdate, "name": name} for hdate, name in holidays])
                 else:
-                    print(f"  No holidays found for country code '{args.country}'")
-                    print(f"  Use 'holidays --country list' to see supported countries")
+                    out_lines = ["", f"📅 Holidays in {args.country} for {year}", "-" * 40]
+                    if holidays:
+                        out_lines.extend(f"  {hdate} ({_WEEKDAY_ABBR[hdate.weekday()]}): {name}" for hdate, name in holidays)
+                    else:
+                        out_lines.append(f"  No holidays found for country code '{args.country}'")
+                        out_lines.append(f"  Use 'holidays --country list' to see supported countries")
+                    sys.stdout.write("\n".join(out_lines) + "\n")
                 
         elif args.command == "weekday":
             d = parse_date(args.date)
-            info = date_info(d)
-            print(f"\n📅 {d} is a {info['day_of_week']}")
+            day_of_week = d.strftime('%A')
+            if args.json:
+                _print_json({"date": d, "day_of_week": day_of_week})
+            else:
+                print(f"\n📅 {d} is a {day_of_week}")
             
         else:
             parser.print_help()